@@ -1,5 +1,7 @@
 """Classification prompt templates for LLM gateway."""
 
+from functools import lru_cache
+
 CLASSIFY_SYSTEM_PROMPT = """You are an email classifier for a multilingual inbox (Czech, English, German, and others). Classify the email into exactly ONE category based on its content, regardless of language.
 
 Categories:
@@ -46,12 +48,17 @@ def build_classify_system_prompt(style_config: dict | None = None) -> str:
         style_names = '"formal", "business", "informal"'
         default_style = "business"
 
-    return CLASSIFY_SYSTEM_PROMPT.format(
-        style_names=style_names or '"formal", "business", "informal"',
-        default_style=default_style,
+    return _render_classify_system_prompt(
+        style_names or '"formal", "business", "informal"', default_style
     )
 
 
+@lru_cache(maxsize=32)
+def _render_classify_system_prompt(style_names: str, default_style: str) -> str:
+    """Format the system prompt template once per distinct style set."""
+    return CLASSIFY_SYSTEM_PROMPT.format(style_names=style_names, default_style=default_style)
+
+
 def build_classify_user_message(
     sender_email: str,
     sender_name: str,
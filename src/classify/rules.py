@@ -9,13 +9,16 @@ from __future__ import annotations
 
 import fnmatch
 import logging
+import re
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleResult:
     category: str
     confidence: str  # 'high', 'medium', 'low'
@@ -24,6 +27,14 @@ class RuleResult:
     is_automated: bool = False  # True if detected as automated/machine-sent
 
 
+# Result for every email without automation signals; immutable, so shared.
+_PASS_TO_LLM = RuleResult(
+    category="needs_response",
+    confidence="low",
+    reasoning="No automation detected, passing to LLM",
+    matched=False,
+)
+
 # Sender address patterns indicating automated/machine-generated email
 AUTOMATED_SENDER_PATTERNS = [
     "noreply",
@@ -38,13 +49,24 @@ AUTOMATED_SENDER_PATTERNS = [
     "bounces",
 ]
 
+# Minimal substring set actually scanned: a pattern that contains a shorter
+# one is redundant ("notifications" is already caught by "notification").
+_SENDER_SCAN_PATTERNS = tuple(
+    p
+    for p in AUTOMATED_SENDER_PATTERNS
+    if not any(q != p and q in p for q in AUTOMATED_SENDER_PATTERNS)
+)
+# ...fused into one alternation so a sender is scanned in a single pass.
+_SENDER_SCAN_RE = re.compile("|".join(map(re.escape, _SENDER_SCAN_PATTERNS)))
+
 # Headers that reliably indicate automated/machine-sent email.
 # Presence of any of these (with qualifying values) → automated.
+# Checks receive the value already stripped and lowercased.
 AUTOMATED_HEADERS = {
     # RFC 3834: auto-generated or auto-replied (value != "no" means automated)
-    "Auto-Submitted": lambda v: v.lower() != "no",
+    "Auto-Submitted": lambda v: v != "no",
     # Bulk/list/auto-reply precedence
-    "Precedence": lambda v: v.lower() in ("bulk", "list", "auto_reply", "junk"),
+    "Precedence": lambda v: v in ("bulk", "list", "auto_reply", "junk"),
     # Mailing list identifier (RFC 2919)
     "List-Id": lambda _: True,
     # Bulk mail unsubscribe header (RFC 2369)
@@ -58,14 +80,20 @@ AUTOMATED_HEADERS = {
     "X-Autorespond": lambda _: True,
 }
 
+# Header names are case-insensitive (RFC 5322); match on lowercased names.
+_AUTOMATED_HEADER_CHECKS = tuple(
+    (name, name.lower(), check_fn) for name, check_fn in AUTOMATED_HEADERS.items()
+)
+_AUTOMATED_HEADER_NAMES = frozenset(lowered for _, lowered, _ in _AUTOMATED_HEADER_CHECKS)
+
 
 def classify_by_rules(
     sender_email: str,
     subject: str,
     snippet: str,
     body: str,
-    blacklist: list[str],
-    headers: dict[str, str] | None = None,
+    blacklist: Sequence[str] = (),
+    headers: Mapping[str, str] | None = None,
 ) -> RuleResult:
     """
     Tier 1: Automation detection only.
@@ -76,8 +104,10 @@ def classify_by_rules(
     All content-based classification (payment, action, FYI, response patterns)
     is delegated entirely to the LLM.
     """
+    sender_lower = sender_email.lower()
+
     # Step 1: Blacklist check
-    if _matches_blacklist(sender_email, blacklist):
+    if _matches_blacklist(sender_lower, blacklist):
         return RuleResult(
             category="fyi",
             confidence="high",
@@ -87,9 +117,7 @@ def classify_by_rules(
         )
 
     # Step 2: No-reply / automated sender check
-    sender_lower = sender_email.lower()
-    automated_sender = any(p in sender_lower for p in AUTOMATED_SENDER_PATTERNS)
-    if automated_sender:
+    if _is_automated_sender(sender_lower):
         return RuleResult(
             category="fyi",
             confidence="high",
@@ -99,7 +127,7 @@ def classify_by_rules(
         )
 
     # Step 3: Header-based automation detection
-    automated_by_headers, header_reason = _detect_automated_headers(headers or {})
+    automated_by_headers, header_reason = _detect_automated_headers(headers)
     if automated_by_headers:
         return RuleResult(
             category="fyi",
@@ -110,33 +138,107 @@ def classify_by_rules(
         )
 
     # No automation detected → LLM decides everything
-    return RuleResult(
-        category="needs_response",
-        confidence="low",
-        reasoning="No automation detected, passing to LLM",
-        matched=False,
-    )
+    return _PASS_TO_LLM
 
 
-def _detect_automated_headers(headers: dict[str, str]) -> tuple[bool, str]:
+@lru_cache(maxsize=4096)
+def _is_automated_sender(sender_lower: str) -> bool:
+    """Check a lowercased sender against the automated sender patterns (cached per sender)."""
+    return _SENDER_SCAN_RE.search(sender_lower) is not None
+
+
+def _detect_automated_headers(headers: Mapping[str, str] | None) -> tuple[bool, str]:
     """Check email headers for signals that the message is automated.
 
     Returns (is_automated, reason_string).
     """
-    for header_name, check_fn in AUTOMATED_HEADERS.items():
-        value = headers.get(header_name)
-        if value is not None and check_fn(value):
+    if not headers:
+        return False, ""
+    folded = {name.lower(): value for name, value in headers.items()}
+    # Most human mail carries none of these headers: one set probe, no per-header loop.
+    if _AUTOMATED_HEADER_NAMES.isdisjoint(folded):
+        return False, ""
+    for header_name, lowered, check_fn in _AUTOMATED_HEADER_CHECKS:
+        value = folded.get(lowered)
+        if value is not None and check_fn(value.strip().lower()):
             return True, f"header {header_name}: {value[:80]}"
     return False, ""
 
 
-def _matches_blacklist(sender_email: str, blacklist: list[str]) -> bool:
-    """Check if sender matches any blacklist glob pattern."""
-    sender_lower = sender_email.lower()
-    for pattern in blacklist:
-        if fnmatch.fnmatch(sender_lower, pattern.lower()):
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class _BlacklistMatcher:
+    """Compiled form of a blacklist.
+
+    ``*@domain`` entries (the common case) become a set of exact domains and
+    glob-free entries a set of exact addresses, each checked with one hash
+    lookup. ``*@*.domain`` entries become a set of parent domains, checked
+    once per label of the sender's domain. Remaining globs are fused into a
+    single alternation regex.
+    """
+
+    domains: frozenset[str]
+    subdomains_of: frozenset[str]
+    addresses: frozenset[str]
+    pattern: re.Pattern[str] | None
+
+    def matches(self, sender_lower: str) -> bool:
+        _, sep, domain = sender_lower.rpartition("@")
+        if sep:
+            if domain in self.domains:
+                return True
+            if self.subdomains_of:
+                dot = domain.find(".")
+                while dot != -1:
+                    if domain[dot + 1 :] in self.subdomains_of:
+                        return True
+                    dot = domain.find(".", dot + 1)
+        if sender_lower in self.addresses:
             return True
-    return False
+        return self.pattern is not None and self.pattern.match(sender_lower) is not None
+
+
+@lru_cache(maxsize=128)
+def _compile_blacklist(blacklist: tuple[str, ...]) -> _BlacklistMatcher:
+    """Sort blacklist globs into exact domains, parent domains, addresses and patterns.
+
+    Cached per blacklist.
+    """
+    domains: set[str] = set()
+    subdomains_of: set[str] = set()
+    addresses: set[str] = set()
+    patterns: list[str] = []
+    for pattern in blacklist:
+        pattern = pattern.lower()
+        local, sep, domain = pattern.partition("@")
+        if local == "*" and sep and "@" not in domain and not _GLOB_CHARS & set(domain):
+            domains.add(domain)
+        elif (
+            local == "*"
+            and domain.startswith("*.")
+            and "@" not in domain
+            and not _GLOB_CHARS & set(domain[2:])
+        ):
+            subdomains_of.add(domain[2:])
+        elif not _GLOB_CHARS & set(pattern):
+            addresses.add(pattern)
+        else:
+            patterns.append(fnmatch.translate(pattern))
+    return _BlacklistMatcher(
+        domains=frozenset(domains),
+        subdomains_of=frozenset(subdomains_of),
+        addresses=frozenset(addresses),
+        pattern=re.compile("|".join(patterns)) if patterns else None,
+    )
+
+
+def _matches_blacklist(sender_lower: str, blacklist: Sequence[str]) -> bool:
+    """Check if an already-lowercased sender matches any blacklist glob pattern."""
+    if not blacklist:
+        return False
+    return _compile_blacklist(tuple(blacklist)).matches(sender_lower)
 
 
 def resolve_communication_style(
@@ -157,10 +259,26 @@ def resolve_communication_style(
 
     # Domain pattern match
     domain_overrides = contacts_config.get("domain_overrides", {})
-    if "@" in sender_email:
-        domain = sender_email.split("@", 1)[1].lower()
-        for pattern, style in domain_overrides.items():
-            if fnmatch.fnmatch(domain, pattern.lower()):
+    if domain_overrides:
+        _, sep, domain = sender_email.rpartition("@")
+        if sep:
+            # Building the hashable key is still O(len(overrides)) per call; the
+            # cache saves the per-pattern glob matching for repeated domains.
+            style = _style_for_domain(domain.lower(), tuple(domain_overrides.items()))
+            if style is not None:
                 return style
 
     return "business"
+
+
+@lru_cache(maxsize=4096)
+def _style_for_domain(domain: str, domain_overrides: tuple[tuple[str, str], ...]) -> str | None:
+    """First domain_overrides style whose glob matches ``domain`` (cached per domain)."""
+    for pattern, style in domain_overrides:
+        pattern = pattern.lower()
+        if _GLOB_CHARS & set(pattern):
+            if fnmatch.fnmatchcase(domain, pattern):
+                return style
+        elif domain == pattern:
+            return style
+    return None
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml
 from pydantic import Field
@@ -46,6 +46,8 @@ class DatabaseConfig(BaseSettings):
     backend: DatabaseBackend = DatabaseBackend.SQLITE
     sqlite_path: Path = REPO_ROOT / "data" / "inbox.db"
     postgresql_url: str = ""
+    # FULL survives power loss; NORMAL/OFF trade durability for speed (tests only)
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "FULL"
 
     model_config = {"env_prefix": "GMA_DB_"}
 
@@ -57,6 +59,7 @@ class LLMSettings(BaseSettings):
     max_classify_tokens: int = 256
     max_draft_tokens: int = 2048
     max_context_tokens: int = 256
+    requests_per_minute: int = 0  # per-process cap on LLM calls; 0 = unlimited
 
     model_config = {"env_prefix": "GMA_LLM_"}
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Generator
@@ -18,6 +19,7 @@ class Database:
 
     def __init__(self, config: AppConfig):
         self.config = config.database
+        self._tx = threading.local()
         self._ensure_db()
 
     def _ensure_db(self) -> None:
@@ -28,7 +30,16 @@ class Database:
 
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection (context manager)."""
+        """Get a database connection (context manager).
+
+        Inside ``transaction()`` this reuses the transaction's connection and
+        leaves commit/rollback to it.
+        """
+        active = getattr(self._tx, "conn", None)
+        if active is not None:
+            yield active
+            return
+
         if self.config.backend == DatabaseBackend.SQLITE:
             conn = sqlite3.connect(
                 str(self.config.sqlite_path),
@@ -36,6 +47,7 @@ class Database:
             )
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.config.sqlite_synchronous}")
             conn.execute("PRAGMA foreign_keys=ON")
             try:
                 yield conn
@@ -48,6 +60,31 @@ class Database:
         else:
             raise NotImplementedError("PostgreSQL backend not yet implemented")
 
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """Group several calls into one connection and a single commit.
+
+        Every execute*/repository call made on this thread inside the block
+        shares the connection; any exception rolls the whole block back.
+        A nested transaction() joins the outer one.
+
+        Synchronous code only: the connection is tracked per thread, so the
+        block must not span an ``await`` (or an ``asyncio.to_thread`` hop) —
+        calls made from another thread open their own connection and do not
+        join the transaction.
+        """
+        active = getattr(self._tx, "conn", None)
+        if active is not None:
+            yield active
+            return
+
+        with self.connection() as conn:
+            self._tx.conn = conn
+            try:
+                yield conn
+            finally:
+                self._tx.conn = None
+
     def execute(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
         """Execute a query and return results as list of dicts."""
         with self.connection() as conn:
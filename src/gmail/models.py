@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import base64
 from dataclasses import dataclass, field
 
 
+def _decode_body(data: str) -> str:
+    """Decode a Gmail base64url body part to text."""
+    return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+
+
 @dataclass
 class Message:
     id: str
@@ -25,13 +31,16 @@ class Message:
         """Parse a Gmail API message resource."""
         payload = data.get("payload", {})
         headers = {h["name"]: h["value"] for h in payload.get("headers", [])}
+        # Header names are case-insensitive (RFC 5322): read parsed fields case-folded
+        folded = {name.lower(): value for name, value in headers.items()}
 
-        sender = headers.get("From", "")
+        sender = folded.get("from", "")
         sender_email = sender
         sender_name = ""
         if "<" in sender and ">" in sender:
-            sender_name = sender.split("<")[0].strip().strip('"')
-            sender_email = sender.split("<")[1].rstrip(">")
+            name, _, address = sender.partition("<")
+            sender_name = name.strip().strip('"')
+            sender_email = address.partition(">")[0]
 
         body = cls._extract_body(payload)
 
@@ -40,11 +49,11 @@ class Message:
             thread_id=data.get("threadId", ""),
             sender_email=sender_email,
             sender_name=sender_name,
-            to=headers.get("To", ""),
-            subject=headers.get("Subject", ""),
+            to=folded.get("to", ""),
+            subject=folded.get("subject", ""),
             snippet=data.get("snippet", ""),
             body=body,
-            date=headers.get("Date", ""),
+            date=folded.get("date", ""),
             internal_date=data.get("internalDate", ""),
             label_ids=data.get("labelIds", []),
             headers=headers,
@@ -53,26 +62,24 @@ class Message:
     @staticmethod
     def _extract_body(payload: dict) -> str:
         """Extract plain text body from message payload."""
-        import base64
-
         # Simple single-part message
         if payload.get("mimeType") == "text/plain" and "body" in payload:
             data = payload["body"].get("data", "")
             if data:
-                return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+                return _decode_body(data)
 
         # Multipart — look for text/plain
         for part in payload.get("parts", []):
             if part.get("mimeType") == "text/plain":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+                    return _decode_body(data)
             # Nested multipart
             for sub in part.get("parts", []):
                 if sub.get("mimeType") == "text/plain":
                     data = sub.get("body", {}).get("data", "")
                     if data:
-                        return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+                        return _decode_body(data)
 
         return ""
 
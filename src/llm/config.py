@@ -15,6 +15,7 @@ class LLMConfig:
     max_classify_tokens: int = 256
     max_draft_tokens: int = 2048
     max_context_tokens: int = 256
+    requests_per_minute: int = 0  # per process; 0 = unlimited
 
     @classmethod
     def from_app_config(cls, config: AppConfig) -> LLMConfig:
@@ -25,4 +26,5 @@ class LLMConfig:
             max_classify_tokens=config.llm.max_classify_tokens,
             max_draft_tokens=config.llm.max_draft_tokens,
             max_context_tokens=config.llm.max_context_tokens,
+            requests_per_minute=config.llm.requests_per_minute,
         )
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 import litellm
 
 from src.llm.config import LLMConfig
+from src.llm.ratelimit import RateLimiter
 
 if TYPE_CHECKING:
     from src.db.models import LLMCallRepository
@@ -35,7 +36,9 @@ class ClassifyResult:
     detected_language: str = "cs"
     resolved_style: str = "business"
 
-    VALID_CATEGORIES = {"needs_response", "action_required", "payment_request", "fyi", "waiting"}
+    VALID_CATEGORIES = frozenset(
+        {"needs_response", "action_required", "payment_request", "fyi", "waiting"}
+    )
 
     @classmethod
     def parse(cls, response: Any) -> ClassifyResult:
@@ -81,6 +84,14 @@ class LLMGateway:
         self.call_repo = call_repo
         # Suppress litellm verbose logging
         litellm.set_verbose = False
+        self.rate_limiter = (
+            RateLimiter(config.requests_per_minute) if config.requests_per_minute > 0 else None
+        )
+
+    def _wait_for_rate_limit(self) -> None:
+        """Block until this process's requests-per-minute budget allows another call."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
 
     def classify(self, system: str, user_message: str, **kwargs: Any) -> ClassifyResult:
         """Call the classification model (fast, cheap model).
@@ -92,6 +103,7 @@ class LLMGateway:
         """
         user_id = kwargs.get("user_id")
         gmail_thread_id = kwargs.get("gmail_thread_id")
+        self._wait_for_rate_limit()
         start_time = time.monotonic()
         error_msg = None
 
@@ -169,6 +181,7 @@ class LLMGateway:
         # Determine if this is a rework call based on kwargs
         is_rework = kwargs.get("is_rework", False)
         call_type = "rework" if is_rework else "draft"
+        self._wait_for_rate_limit()
         start_time = time.monotonic()
         error_msg = None
 
@@ -239,6 +252,7 @@ class LLMGateway:
         """
         user_id = kwargs.get("user_id")
         gmail_thread_id = kwargs.get("gmail_thread_id")
+        self._wait_for_rate_limit()
         start_time = time.monotonic()
         error_msg = None
 
@@ -321,6 +335,7 @@ class LLMGateway:
         user_id = kwargs.get("user_id")
         gmail_thread_id = kwargs.get("gmail_thread_id")
         used_model = model or self.config.draft_model
+        self._wait_for_rate_limit()
         start_time = time.monotonic()
 
         try:
@@ -0,0 +1,47 @@
+"""Client-side rate limiting for LLM calls.
+
+The gateway is called concurrently from worker threads. Without a budget,
+bursts trip the provider's per-minute limit and every caller stalls in 429
+back-off. A limiter spaces calls evenly instead.
+
+The budget is per process: each process (uvicorn worker, xdist test worker)
+builds its own gateway and limiter. Size requests_per_minute as the provider
+limit divided by the number of processes sharing the API key.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Thread-safe limiter allowing ``requests_per_minute`` acquisitions per minute.
+
+    Virtual-scheduling (GCRA) form: each ``acquire`` reserves the next free slot
+    under a lock and sleeps outside it, so waiting threads are served in arrival
+    order and calls start at least ``60 / requests_per_minute`` seconds apart.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self._interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> float:
+        """Block until a call may start. Returns the seconds spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            wait = slot - now
+            self._next_slot = slot + self._interval
+
+        if wait > 0:
+            logger.debug("LLM rate limit reached, waiting %.2fs", wait)
+            time.sleep(wait)
+        return wait
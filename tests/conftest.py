@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 import pytest
 import yaml
 
 from src.llm.config import LLMConfig
-from src.llm.gateway import LLMGateway
+from src.llm.gateway import ClassifyResult, LLMGateway
+
+T = TypeVar("T")
 
 
 def _has_llm_api_key() -> bool:
@@ -24,9 +29,82 @@ def _llm_config() -> LLMConfig:
         classify_model=os.getenv("GMA_LLM_CLASSIFY_MODEL", LLMConfig.classify_model),
         draft_model=os.getenv("GMA_LLM_DRAFT_MODEL", LLMConfig.draft_model),
         context_model=os.getenv("GMA_LLM_CONTEXT_MODEL", LLMConfig.context_model),
+        requests_per_minute=_per_worker_requests_per_minute(),
     )
 
 
+def _per_worker_requests_per_minute() -> int:
+    """Split GMA_LLM_REQUESTS_PER_MINUTE across xdist workers.
+
+    Each worker process builds its own gateway and rate limiter, so the
+    configured budget is divided to keep the whole run under it (at least 1
+    per worker, so budgets below the worker count are exceeded).
+    """
+    total = int(os.getenv("GMA_LLM_REQUESTS_PER_MINUTE", "0"))
+    if total <= 0:
+        return 0
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return max(1, total // workers)
+
+
+class _MemoizingGateway(LLMGateway):
+    """LLMGateway that answers repeated identical classify/draft prompts from memory.
+
+    Enabled with GMA_E2E_CACHE=1. Lives for one test session (one per xdist
+    worker); leave it off when a test needs a fresh completion for every call.
+    """
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        self._memo: dict[tuple, Any] = {}
+
+    def _memoized(
+        self,
+        method: Callable[..., T],
+        failed: Callable[[T], bool],
+        system: str,
+        user_message: str,
+        **kwargs: Any,
+    ) -> T:
+        key = (method.__name__, system, user_message, tuple(sorted(kwargs.items())))
+        if key in self._memo:
+            return self._memo[key]
+        result = method(self, system, user_message, **kwargs)
+        if not failed(result):  # never pin a transient API error for the session
+            self._memo[key] = result
+        return result
+
+    def classify(self, system: str, user_message: str, **kwargs: Any) -> ClassifyResult:
+        return self._memoized(
+            LLMGateway.classify,
+            lambda r: r.reasoning.startswith("LLM error:"),
+            system,
+            user_message,
+            **kwargs,
+        )
+
+    def draft(self, system: str, user_message: str, **kwargs: Any) -> str:
+        return self._memoized(
+            LLMGateway.draft,
+            lambda r: r.startswith("[ERROR:"),
+            system,
+            user_message,
+            **kwargs,
+        )
+
+
+@functools.cache
+def load_classification_fixture() -> dict:
+    """Parse the classification YAML once (also used at collection time to parametrize)."""
+    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "classification_cases.yaml")
+    with open(fixture_path) as f:
+        fixture = yaml.safe_load(f)
+    ids = [case["id"] for case in fixture["cases"]]
+    duplicates = sorted({case_id for case_id in ids if ids.count(case_id) > 1})
+    assert not duplicates, f"duplicate case ids in {fixture_path}: {duplicates}"
+    return fixture
+
+
 # ── skip marker ──────────────────────────────────────────────────────────────
 
 skip_without_api_key = pytest.mark.skipif(
@@ -46,26 +124,16 @@ def llm_config() -> LLMConfig:
 
 @pytest.fixture(scope="session")
 def llm_gateway(llm_config: LLMConfig) -> LLMGateway:
-    """Session-scoped LLM gateway backed by a real API."""
+    """Session-scoped LLM gateway backed by a real API (memoized with GMA_E2E_CACHE=1)."""
+    if os.getenv("GMA_E2E_CACHE") == "1":
+        return _MemoizingGateway(llm_config)
     return LLMGateway(llm_config)
 
 
-@pytest.fixture(scope="session")
-def classification_cases() -> list[dict]:
-    """Load classification test cases from the YAML fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "classification_cases.yaml")
-    with open(fixture_path) as f:
-        data = yaml.safe_load(f)
-    return data["cases"]
-
-
 @pytest.fixture(scope="session")
 def classification_defaults() -> dict:
     """Load defaults from the YAML fixture."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "classification_cases.yaml")
-    with open(fixture_path) as f:
-        data = yaml.safe_load(f)
-    return data.get("defaults", {})
+    return load_classification_fixture().get("defaults", {})
 
 
 @pytest.fixture(scope="session")
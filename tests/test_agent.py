@@ -576,6 +576,7 @@ class TestAgentRunRepository:
         config.database = DatabaseConfig(
             backend=DatabaseBackend.SQLITE,
             sqlite_path=tmp_path / "test.db",
+            sqlite_synchronous="OFF",
         )
         database = Database(config)
         database.initialize_schema()
@@ -8,25 +8,40 @@ automated emails and passes everything else to the LLM.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
 from src.classify.rules import classify_by_rules
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def classify(
-    sender: str = "person@example.com",
-    subject: str = "",
-    body: str = "",
-    snippet: str = "",
-    blacklist: list[str] | None = None,
-    headers: dict[str, str] | None = None,
-) -> tuple[str, str, bool, bool]:
+@dataclass(frozen=True, slots=True)
+class EmailInput:
+    sender: str = "person@example.com"
+    subject: str = ""
+    body: str = ""
+    snippet: str = ""
+    blacklist: tuple[str, ...] = ()
+    headers: dict[str, str] | None = None
+
+
+def run(email: EmailInput) -> tuple[str, str, bool, bool]:
     """Run classification and return (category, confidence, matched, is_automated)."""
-    result = classify_by_rules(sender, subject, snippet, body, blacklist or [], headers=headers)
+    result = classify_by_rules(
+        email.sender, email.subject, email.snippet, email.body, email.blacklist, email.headers
+    )
     return result.category, result.confidence, result.matched, result.is_automated
 
 
+def classify(**fields: Any) -> tuple[str, str, bool, bool]:
+    """Build an EmailInput from keyword fields and run it."""
+    return run(EmailInput(**fields))
+
+
 # ── Blacklisted senders → fyi ───────────────────────────────────────────────
 
 
@@ -36,7 +51,7 @@ class TestBlacklist:
             sender="bot@noreply.github.com",
             subject="Important question?",
             body="Can you review this PR?",
-            blacklist=["*@noreply.github.com"],
+            blacklist=("*@noreply.github.com",),
         )
         assert cat == "fyi"
         assert matched is True
@@ -47,7 +62,7 @@ class TestBlacklist:
             sender="bot@spam.com",
             subject="Urgent invoice - please sign",
             body="Pay immediately. Please approve.",
-            blacklist=["*@spam.com"],
+            blacklist=("*@spam.com",),
         )
         assert cat == "fyi"
         assert matched is True
@@ -58,96 +73,100 @@ class TestBlacklist:
 
 
 class TestAutomatedSenders:
-    def test_noreply_sender(self):
-        cat, _, matched, automated = classify(
-            sender="noreply@company.com",
-            subject="Your order has shipped",
-        )
+    @pytest.mark.parametrize(
+        "sender,subject",
+        [
+            pytest.param("noreply@company.com", "Your order has shipped", id="noreply"),
+            pytest.param("notifications@github.com", "New comment on PR #123", id="notifications"),
+            pytest.param("mailer-daemon@google.com", "Delivery failed", id="mailer_daemon"),
+            pytest.param("do-not-reply@company.com", "", id="do_not_reply"),
+            pytest.param("donotreply@company.com", "", id="donotreply"),
+            pytest.param("postmaster@mail.company.com", "", id="postmaster"),
+            pytest.param("bounce@mail.company.com", "", id="bounce"),
+            pytest.param("notification@app.com", "", id="notification"),
+        ],
+    )
+    def test_automated_sender(self, sender, subject):
+        cat, _, matched, automated = classify(sender=sender, subject=subject)
         assert cat == "fyi"
         assert matched is True
         assert automated is True
 
-    def test_notifications_sender(self):
-        cat, _, matched, automated = classify(
-            sender="notifications@github.com",
-            subject="New comment on PR #123",
-        )
-        assert cat == "fyi"
-        assert matched is True
-        assert automated is True
-
-    def test_mailer_daemon(self):
-        cat, _, matched, automated = classify(
-            sender="mailer-daemon@google.com",
-            subject="Delivery failed",
-        )
-        assert cat == "fyi"
-        assert matched is True
-        assert automated is True
-
-    def test_do_not_reply(self):
-        cat, _, matched, _ = classify(sender="do-not-reply@company.com")
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_donotreply(self):
-        cat, _, matched, _ = classify(sender="donotreply@company.com")
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_postmaster(self):
-        cat, _, matched, _ = classify(sender="postmaster@mail.company.com")
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_bounce(self):
-        cat, _, matched, _ = classify(sender="bounce@mail.company.com")
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_notification_singular(self):
-        cat, _, matched, _ = classify(sender="notification@app.com")
-        assert cat == "fyi"
-        assert matched is True
-
 
 # ── Automated header detection → fyi ────────────────────────────────────────
 
 
 class TestAutomatedHeaders:
-    def test_list_unsubscribe_header(self):
+    @pytest.mark.parametrize(
+        "sender,subject,body,headers",
+        [
+            pytest.param(
+                "promo@shop.com",
+                "50% off sale!",
+                "Check out our latest deals.",
+                {"List-Unsubscribe": "<mailto:unsub@shop.com>"},
+                id="list_unsubscribe",
+            ),
+            pytest.param(
+                "system@company.com",
+                "Your report is ready",
+                "Hi, can you review the attached report?",
+                {"Auto-Submitted": "auto-generated"},
+                id="auto_submitted_generated",
+            ),
+            pytest.param(
+                "colleague@company.com",
+                "Re: Project update",
+                "I am currently out of office.",
+                {"Auto-Submitted": "auto-replied"},
+                id="auto_submitted_replied",
+            ),
+            pytest.param(
+                "updates@service.com",
+                "Weekly digest",
+                "",
+                {"Precedence": "bulk"},
+                id="precedence_bulk",
+            ),
+            pytest.param(
+                "user@mailinglist.org",
+                "Re: Discussion topic",
+                "",
+                {"Precedence": "list"},
+                id="precedence_list",
+            ),
+            pytest.param(
+                "dev@lists.project.org",
+                "RFC: New API design",
+                "",
+                {"List-Id": "<dev.lists.project.org>"},
+                id="list_id",
+            ),
+            pytest.param(
+                "hello@startup.com",
+                "We'd love your feedback",
+                "",
+                {"Feedback-ID": "123:campaign:startup"},
+                id="feedback_id",
+            ),
+            pytest.param(
+                "calendar@company.com",
+                "Your schedule for today",
+                "",
+                {"X-Auto-Response-Suppress": "All"},
+                id="auto_response_suppress",
+            ),
+        ],
+    )
+    def test_automated_header(self, sender, subject, body, headers):
         cat, conf, matched, automated = classify(
-            sender="promo@shop.com",
-            subject="50% off sale!",
-            body="Check out our latest deals.",
-            headers={"List-Unsubscribe": "<mailto:unsub@shop.com>"},
+            sender=sender, subject=subject, body=body, headers=headers
         )
         assert cat == "fyi"
         assert conf == "high"
         assert matched is True
         assert automated is True
 
-    def test_auto_submitted_header(self):
-        cat, _, matched, automated = classify(
-            sender="system@company.com",
-            subject="Your report is ready",
-            body="Hi, can you review the attached report?",
-            headers={"Auto-Submitted": "auto-generated"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-        assert automated is True
-
-    def test_auto_submitted_auto_replied(self):
-        cat, _, matched, _ = classify(
-            sender="colleague@company.com",
-            subject="Re: Project update",
-            body="I am currently out of office.",
-            headers={"Auto-Submitted": "auto-replied"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-
     def test_auto_submitted_no_is_human(self):
         """Auto-Submitted: no means human-sent — should NOT be treated as automated."""
         cat, _, matched, automated = classify(
@@ -159,123 +178,60 @@ class TestAutomatedHeaders:
         assert matched is False
         assert automated is False
 
-    def test_precedence_bulk(self):
-        cat, _, matched, _ = classify(
-            sender="updates@service.com",
-            subject="Weekly digest",
-            headers={"Precedence": "bulk"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_precedence_list(self):
-        cat, _, matched, _ = classify(
-            sender="user@mailinglist.org",
-            subject="Re: Discussion topic",
-            headers={"Precedence": "list"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_list_id_header(self):
-        cat, _, matched, _ = classify(
-            sender="dev@lists.project.org",
-            subject="RFC: New API design",
-            headers={"List-Id": "<dev.lists.project.org>"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_feedback_id_header(self):
-        cat, _, matched, _ = classify(
-            sender="hello@startup.com",
-            subject="We'd love your feedback",
-            headers={"Feedback-ID": "123:campaign:startup"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-
-    def test_x_auto_response_suppress(self):
-        cat, _, matched, _ = classify(
-            sender="calendar@company.com",
-            subject="Your schedule for today",
-            headers={"X-Auto-Response-Suppress": "All"},
-        )
-        assert cat == "fyi"
-        assert matched is True
-
 
 # ── Content-based emails pass through to LLM ────────────────────────────────
 
-
-class TestPassToLLM:
-    """All content-based classification is delegated to the LLM.
-
-    The rule tier should return matched=False for all non-automated emails.
-    """
-
-    def test_invoice_passes_to_llm(self):
-        """Payment emails are no longer matched by rules — LLM handles them."""
-        _, _, matched, _ = classify(
+# No automation signals in any of these, whatever the content says.
+PASS_TO_LLM_CASES = [
+    pytest.param(
+        EmailInput(
             subject="Invoice #2024-0045",
             body="Please find attached invoice for services rendered.",
-        )
-        assert matched is False
-
-    def test_meeting_request_passes_to_llm(self):
-        """Meeting requests are no longer matched by rules — LLM handles them."""
-        _, _, matched, _ = classify(
+        ),
+        id="invoice",
+    ),
+    pytest.param(
+        EmailInput(
             sender="petr.ivan@example.com",
             subject="žádost o schůzku",
             body="Dobrý den. Mohli bychom se potkat?",
-        )
-        assert matched is False
-
-    def test_action_required_passes_to_llm(self):
-        _, _, matched, _ = classify(
-            body="Please sign the attached contract.",
-        )
-        assert matched is False
-
-    def test_question_passes_to_llm(self):
-        _, _, matched, _ = classify(
-            body="Are you free tomorrow afternoon?",
-        )
-        assert matched is False
-
-    def test_newsletter_content_passes_to_llm(self):
-        """Content mentioning 'newsletter' no longer matched by rules — LLM handles."""
-        _, _, matched, _ = classify(
+        ),
+        id="meeting_cs",
+    ),
+    pytest.param(EmailInput(body="Please sign the attached contract."), id="sign"),
+    pytest.param(EmailInput(body="Are you free tomorrow afternoon?"), id="question"),
+    pytest.param(
+        EmailInput(
             sender="editor@news.com",
             subject="Weekly Newsletter: Top Stories",
             body="Here are this week's top stories.",
-        )
-        assert matched is False
+        ),
+        id="newsletter",
+    ),
+    pytest.param(
+        EmailInput(subject="Project update", body="Here is the latest version of the document."),
+        id="update",
+    ),
+    pytest.param(EmailInput(sender="x@x.com"), id="empty"),
+    pytest.param(
+        EmailInput(sender="colleague@company.com", body="Can you help me with this?"),
+        id="no_headers",
+    ),
+    pytest.param(
+        EmailInput(sender="colleague@company.com", body="Can you help me with this?", headers={}),
+        id="empty_headers",
+    ),
+]
 
-    def test_generic_update_passes_to_llm(self):
-        _, _, matched, _ = classify(
-            subject="Project update",
-            body="Here is the latest version of the document.",
-        )
-        assert matched is False
 
-    def test_empty_email_passes_to_llm(self):
-        _, _, matched, _ = classify(sender="x@x.com")
-        assert matched is False
+class TestPassToLLM:
+    """All content-based classification is delegated to the LLM.
 
-    def test_no_headers_no_automation(self):
-        _, _, matched, automated = classify(
-            sender="colleague@company.com",
-            body="Can you help me with this?",
-        )
-        assert matched is False
-        assert automated is False
+    The rule tier should return matched=False for all non-automated emails.
+    """
 
-    def test_empty_headers_no_automation(self):
-        _, _, matched, automated = classify(
-            sender="colleague@company.com",
-            body="Can you help me with this?",
-            headers={},
-        )
+    @pytest.mark.parametrize("email", PASS_TO_LLM_CASES)
+    def test_content_email_passes_through(self, email):
+        _, _, matched, automated = run(email)
         assert matched is False
         assert automated is False
@@ -6,7 +6,7 @@ not just metadata/snippets.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import pytest
 
 from src.context.gatherer import ContextGatherer, GatheredContext
 from src.context.prompts import CONTEXT_SYSTEM_PROMPT, build_context_user_message
@@ -14,6 +14,11 @@ from src.draft.prompts import build_draft_user_message
 from src.gmail.models import Message, Thread
 
 
+# Oversized payloads for truncation tests, built once.
+_LONG_BODY = "x" * 3000
+_LONG_SNIPPET = "x" * 500
+
+
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
 
@@ -41,66 +46,96 @@ def _make_thread(thread_id: str, messages: list[Message] | None = None) -> Threa
     return Thread(id=thread_id, messages=messages or [])
 
 
+# Ten search hits on distinct threads, shared read-only across tests.
+_TEN_THREAD_HITS = tuple(_make_message(f"m{i}", f"thread_{i}") for i in range(10))
+
+
+class _StubGateway:
+    """Stands in for LLMGateway: returns a fixed query response or raises."""
+
+    __slots__ = ("exc", "raw_response")
+
+    def __init__(self, raw_response: str = "", exc: Exception | None = None):
+        self.raw_response = raw_response
+        self.exc = exc
+
+    def generate_context_queries(self, *args, **kwargs) -> str:
+        if self.exc is not None:
+            raise self.exc
+        return self.raw_response
+
+
+class _StubGmailClient:
+    """Stands in for UserGmailClient search and thread fetches.
+
+    Each search_metadata call consumes the next entry of ``search_results``;
+    exception entries are raised. ``threads`` maps thread IDs to threads.
+    """
+
+    __slots__ = ("_search_results", "thread_error", "threads")
+
+    def __init__(
+        self,
+        search_results: list[list[Message] | Exception] | None = None,
+        threads: dict[str, Thread] | None = None,
+        thread_error: Exception | None = None,
+    ):
+        self._search_results = iter(search_results) if search_results is not None else None
+        self.threads = threads
+        self.thread_error = thread_error
+
+    def search_metadata(self, query: str, max_results: int = 10) -> list[Message]:
+        if self._search_results is None:
+            return []
+        result = next(self._search_results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def get_thread(self, thread_id: str) -> Thread | None:
+        if self.thread_error is not None:
+            raise self.thread_error
+        if self.threads is not None:
+            return self.threads.get(thread_id)
+        # Default: return thread with single empty message
+        return _make_thread(thread_id, [_make_message("m", thread_id, body="Thread body content")])
+
+
 def _mock_gateway(raw_response: str = '["from:test@example.com", "project alpha"]'):
-    gw = MagicMock()
-    gw.generate_context_queries.return_value = raw_response
-    return gw
+    return _StubGateway(raw_response)
 
 
 def _mock_gmail_client(
-    messages_per_query: list[list[Message]] | None = None,
+    messages_per_query: list[list[Message] | Exception] | None = None,
     threads: dict[str, Thread] | None = None,
+    thread_error: Exception | None = None,
 ):
-    client = MagicMock()
-    if messages_per_query is not None:
-        client.search_metadata.side_effect = messages_per_query
-    else:
-        client.search_metadata.return_value = []
-
-    if threads is not None:
-        client.get_thread.side_effect = lambda tid: threads.get(tid)
-    else:
-        # Default: return thread with single empty message
-        client.get_thread.side_effect = lambda tid: _make_thread(
-            tid, [_make_message("m", tid, body="Thread body content")]
-        )
-    return client
+    return _StubGmailClient(messages_per_query, threads, thread_error)
 
 
 # ── Query parsing tests ──────────────────────────────────────────────────────
 
 
 class TestQueryParsing:
-    def test_valid_json_returns_list(self):
-        gw = _mock_gateway('["from:test@example.com", "project alpha", "invoice 123"]')
-        gatherer = ContextGatherer(gw)
-        queries = gatherer._generate_queries("test@example.com", "Subject", "Body")
-        assert queries == ["from:test@example.com", "project alpha", "invoice 123"]
-
-    def test_malformed_json_returns_empty(self):
-        gw = _mock_gateway("this is not json")
-        gatherer = ContextGatherer(gw)
-        queries = gatherer._generate_queries("test@example.com", "Subject", "Body")
-        assert queries == []
-
-    def test_more_than_3_queries_capped(self):
-        gw = _mock_gateway('["q1", "q2", "q3", "q4", "q5"]')
-        gatherer = ContextGatherer(gw)
-        queries = gatherer._generate_queries("test@example.com", "Subject", "Body")
-        assert len(queries) == 3
-        assert queries == ["q1", "q2", "q3"]
-
-    def test_non_array_returns_empty(self):
-        gw = _mock_gateway('{"query": "from:test@example.com"}')
-        gatherer = ContextGatherer(gw)
-        queries = gatherer._generate_queries("test@example.com", "Subject", "Body")
-        assert queries == []
-
-    def test_empty_array_returns_empty(self):
-        gw = _mock_gateway("[]")
-        gatherer = ContextGatherer(gw)
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (
+                '["from:test@example.com", "project alpha", "invoice 123"]',
+                ["from:test@example.com", "project alpha", "invoice 123"],
+            ),
+            ("this is not json", []),
+            # More than 3 queries are capped
+            ('["q1", "q2", "q3", "q4", "q5"]', ["q1", "q2", "q3"]),
+            ('{"query": "from:test@example.com"}', []),
+            ("[]", []),
+        ],
+        ids=["valid_json", "malformed_json", "capped_at_3", "non_array", "empty_array"],
+    )
+    def test_generate_queries(self, raw, expected):
+        gatherer = ContextGatherer(_mock_gateway(raw))
         queries = gatherer._generate_queries("test@example.com", "Subject", "Body")
-        assert queries == []
+        assert queries == expected
 
 
 # ── Search and dedup tests ───────────────────────────────────────────────────
@@ -145,8 +180,7 @@ class TestSearchAndDeduplicate:
         gw = _mock_gateway()
         gatherer = ContextGatherer(gw)
 
-        messages = [_make_message(f"m{i}", f"thread_{i}") for i in range(10)]
-        client = _mock_gmail_client([messages])
+        client = _mock_gmail_client([list(_TEN_THREAD_HITS)])
 
         results = gatherer._search_and_deduplicate(client, ["query1"], exclude_thread_id="none")
         assert len(results) == 5
@@ -156,10 +190,13 @@ class TestSearchAndDeduplicate:
         gatherer = ContextGatherer(gw)
 
         msg = _make_message("m1", "thread_a")
-        client = MagicMock()
-        client.search_metadata.side_effect = [Exception("API error"), [msg]]
-        client.get_thread.return_value = _make_thread(
-            "thread_a", [_make_message("m1", "thread_a", body="Content")]
+        client = _mock_gmail_client(
+            [Exception("API error"), [msg]],
+            threads={
+                "thread_a": _make_thread(
+                    "thread_a", [_make_message("m1", "thread_a", body="Content")]
+                )
+            },
         )
 
         results = gatherer._search_and_deduplicate(
@@ -195,9 +232,8 @@ class TestSearchAndDeduplicate:
         gatherer = ContextGatherer(gw)
 
         msg = _make_message("m1", "thread_a")
-        long_body = "x" * 3000
         thread = _make_thread("thread_a", [
-            _make_message("m1", "thread_a", body=long_body),
+            _make_message("m1", "thread_a", body=_LONG_BODY),
         ])
         client = _mock_gmail_client(
             [[msg]],
@@ -216,8 +252,7 @@ class TestSearchAndDeduplicate:
         gatherer = ContextGatherer(gw)
 
         msg = _make_message("m1", "thread_a")
-        client = _mock_gmail_client([[msg]])
-        client.get_thread.side_effect = Exception("Thread fetch failed")
+        client = _mock_gmail_client([[msg]], thread_error=Exception("Thread fetch failed"))
 
         results = gatherer._search_and_deduplicate(
             client, ["query1"], exclude_thread_id="none"
@@ -263,21 +298,20 @@ class TestGatheredContext:
                 },
             ]
         )
-        result = ctx.format_for_prompt()
-        assert "--- Related emails from your mailbox ---" in result
-        assert "--- End related emails ---" in result
-        assert "1. From: Alice <alice@example.com>" in result
-        assert "Subject: Project update" in result
-        assert "Here is the full conversation about the project." in result
-        assert "2. From: bob@example.com" in result
-        assert "Please pay the attached invoice for January." in result
+        assert ctx.format_for_prompt() == (
+            "--- Related emails from your mailbox ---\n"
+            "1. From: Alice <alice@example.com> | Subject: Project update\n"
+            "   Here is the full conversation about the project.\n"
+            "2. From: bob@example.com | Subject: Invoice\n"
+            "   Please pay the attached invoice for January.\n"
+            "--- End related emails ---"
+        )
 
     def test_format_for_prompt_falls_back_to_snippet(self):
         """When body is empty, falls back to snippet (truncated at 200 chars)."""
-        long_snippet = "x" * 500
         ctx = GatheredContext(
             related_threads=[
-                {"thread_id": "t1", "sender": "a", "subject": "b", "body": "", "snippet": long_snippet},
+                {"thread_id": "t1", "sender": "a", "subject": "b", "body": "", "snippet": _LONG_SNIPPET},
             ]
         )
         result = ctx.format_for_prompt()
@@ -322,8 +356,7 @@ class TestGather:
         assert ctx.related_threads[1]["body"] == "Alpha update body"
 
     def test_llm_failure_returns_empty(self):
-        gw = MagicMock()
-        gw.generate_context_queries.side_effect = Exception("LLM down")
+        gw = _StubGateway(exc=Exception("LLM down"))
         gatherer = ContextGatherer(gw)
 
         client = _mock_gmail_client()
@@ -334,8 +367,7 @@ class TestGather:
         gw = _mock_gateway('["from:test@example.com"]')
         gatherer = ContextGatherer(gw)
 
-        client = MagicMock()
-        client.search_metadata.side_effect = Exception("Gmail API error")
+        client = _mock_gmail_client([Exception("Gmail API error")])
 
         ctx = gatherer.gather(client, "thread_1", "test@example.com", "Sub", "Body")
         # Should return empty context (no results), not raise
@@ -372,28 +404,16 @@ class TestPromptIntegration:
             sender_name="Test",
             subject="Hello",
             thread_body="How are you?",
+            user_instructions="Be brief",
             related_context=context,
         )
         assert "--- Related emails from your mailbox ---" in msg
         assert "--- End related emails ---" in msg
-        # Context should appear after thread body
+        # Context sits between the thread body and the user instructions
         thread_pos = msg.index("How are you?")
         context_pos = msg.index("Related emails")
-        assert context_pos > thread_pos
-
-    def test_build_draft_user_message_context_before_instructions(self):
-        context = "--- Related emails from your mailbox ---\n1. From: a | Subject: b\n--- End related emails ---"
-        msg = build_draft_user_message(
-            sender_email="test@example.com",
-            sender_name="Test",
-            subject="Hello",
-            thread_body="How are you?",
-            user_instructions="Be brief",
-            related_context=context,
-        )
-        context_pos = msg.index("Related emails")
         instructions_pos = msg.index("User instructions")
-        assert context_pos < instructions_pos
+        assert thread_pos < context_pos < instructions_pos
 
 
 # ── Prompt content tests ─────────────────────────────────────────────────────
@@ -413,7 +433,6 @@ class TestContextPrompts:
         assert "Latest status" in msg
 
     def test_build_context_user_message_truncates_body(self):
-        long_body = "x" * 3000
-        msg = build_context_user_message("a@b.com", "Sub", long_body)
+        msg = build_context_user_message("a@b.com", "Sub", _LONG_BODY)
         # Body should be truncated to 1500 chars
         assert len(msg) < 3000
@@ -1,7 +1,10 @@
 """Tests for database layer."""
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -18,17 +21,49 @@ from src.db.models import (
 )
 
 
-@pytest.fixture
-def db(tmp_path):
-    """Create a temporary database for testing."""
+def _make_db(sqlite_path: Path) -> Database:
     config = AppConfig()
     config.database = DatabaseConfig(
         backend=DatabaseBackend.SQLITE,
-        sqlite_path=tmp_path / "test.db",
+        sqlite_path=sqlite_path,
+        sqlite_synchronous="OFF",  # throwaway files: skip fsync
+    )
+    return Database(config)
+
+
+def _connection_and_lookup(db: Database, repo: UserRepository, email: str):
+    with db.connection() as conn:
+        return conn, repo.get_by_email(email)
+
+
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory) -> Path:
+    """Database file with the schema applied, built once per session."""
+    path = tmp_path_factory.mktemp("schema") / "template.db"
+    _make_db(path).initialize_schema()
+    return path
+
+
+@pytest.fixture
+def db(tmp_path, schema_template):
+    """Create a temporary database for testing (a copy of the schema template)."""
+    sqlite_path = tmp_path / "test.db"
+    shutil.copyfile(schema_template, sqlite_path)
+    return _make_db(sqlite_path)
+
+
+@pytest.fixture
+def repos(db):
+    """All repositories over ``db``, with the default user (id 1) already created."""
+    UserRepository(db).create("test@example.com")
+    return SimpleNamespace(
+        user=UserRepository(db),
+        email=EmailRepository(db),
+        event=EventRepository(db),
+        job=JobRepository(db),
+        label=LabelRepository(db),
+        settings=SettingsRepository(db),
     )
-    database = Database(config)
-    database.initialize_schema()
-    return database
 
 
 class TestUserRepository:
@@ -55,11 +90,11 @@ class TestUserRepository:
 
 
 class TestLabelRepository:
-    def test_set_and_get(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = LabelRepository(db)
-        repo.set_label(1, "needs_response", "Label_34", "🤖 AI/Needs Response")
-        repo.set_label(1, "fyi", "Label_39", "🤖 AI/FYI")
+    def test_set_and_get(self, db, repos):
+        repo = repos.label
+        with db.transaction():
+            repo.set_label(1, "needs_response", "Label_34", "🤖 AI/Needs Response")
+            repo.set_label(1, "fyi", "Label_39", "🤖 AI/FYI")
 
         labels = repo.get_labels(1)
         assert labels["needs_response"] == "Label_34"
@@ -67,9 +102,8 @@ class TestLabelRepository:
 
 
 class TestEmailRepository:
-    def test_upsert_and_get(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = EmailRepository(db)
+    def test_upsert_and_get(self, repos):
+        repo = repos.email
 
         record = EmailRecord(
             user_id=1,
@@ -87,26 +121,25 @@ class TestEmailRepository:
         assert result["classification"] == "needs_response"
         assert result["sender_email"] == "sender@example.com"
 
-    def test_get_pending_drafts(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = EmailRepository(db)
+    def test_get_pending_drafts(self, db, repos):
+        repo = repos.email
 
-        for i in range(3):
-            record = EmailRecord(
-                user_id=1,
-                gmail_thread_id=f"thread_{i}",
-                gmail_message_id=f"msg_{i}",
-                sender_email="sender@example.com",
-                classification="needs_response" if i < 2 else "fyi",
-            )
-            repo.upsert(record)
+        with db.transaction():
+            for i in range(3):
+                record = EmailRecord(
+                    user_id=1,
+                    gmail_thread_id=f"thread_{i}",
+                    gmail_message_id=f"msg_{i}",
+                    sender_email="sender@example.com",
+                    classification="needs_response" if i < 2 else "fyi",
+                )
+                repo.upsert(record)
 
         pending = repo.get_pending_drafts(1)
         assert len(pending) == 2
 
-    def test_update_status(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = EmailRepository(db)
+    def test_update_status(self, repos):
+        repo = repos.email
 
         record = EmailRecord(
             user_id=1,
@@ -123,12 +156,12 @@ class TestEmailRepository:
 
 
 class TestEventRepository:
-    def test_log_and_retrieve(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = EventRepository(db)
+    def test_log_and_retrieve(self, db, repos):
+        repo = repos.event
 
-        repo.log(1, "thread_1", "classified", "needs_response (high)")
-        repo.log(1, "thread_1", "draft_created", "Draft with business style")
+        with db.transaction():
+            repo.log(1, "thread_1", "classified", "needs_response (high)")
+            repo.log(1, "thread_1", "draft_created", "Draft with business style")
 
         events = repo.get_thread_events(1, "thread_1")
         assert len(events) == 2
@@ -137,9 +170,8 @@ class TestEventRepository:
 
 
 class TestJobRepository:
-    def test_enqueue_and_claim(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = JobRepository(db)
+    def test_enqueue_and_claim(self, repos):
+        repo = repos.job
 
         repo.enqueue("classify", 1, {"message_id": "msg_1"})
         job = repo.claim_next()
@@ -152,9 +184,8 @@ class TestJobRepository:
         repo = JobRepository(db)
         assert repo.claim_next() is None
 
-    def test_complete_job(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = JobRepository(db)
+    def test_complete_job(self, repos):
+        repo = repos.job
 
         repo.enqueue("sync", 1)
         job = repo.claim_next()
@@ -163,9 +194,8 @@ class TestJobRepository:
         # Should not be claimable again
         assert repo.claim_next() is None
 
-    def test_retry_job(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = JobRepository(db)
+    def test_retry_job(self, repos):
+        repo = repos.job
 
         repo.enqueue("classify", 1)
         job = repo.claim_next()
@@ -178,9 +208,8 @@ class TestJobRepository:
 
 
 class TestSettingsRepository:
-    def test_set_and_get(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = SettingsRepository(db)
+    def test_set_and_get(self, repos):
+        repo = repos.settings
 
         repo.set(1, "default_language", "cs")
         assert repo.get(1, "default_language") == "cs"
@@ -189,13 +218,55 @@ class TestSettingsRepository:
         repo = SettingsRepository(db)
         assert repo.get(999, "missing") is None
 
-    def test_json_value(self, db):
-        UserRepository(db).create("test@example.com")
-        repo = SettingsRepository(db)
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"default": "business", "styles": {"formal": {"rules": ["be polite"]}}},
+            ["cs", "en"],
+            42,
+            True,
+        ],
+        ids=["nested_dict", "list", "int", "bool"],
+    )
+    def test_json_value(self, repos, value):
+        repo = repos.settings
+
+        repo.set(1, "communication_styles", value)
+        assert repo.get(1, "communication_styles") == value
+
+
+class TestConnection:
+    def test_synchronous_defaults_to_full(self):
+        assert DatabaseConfig().sqlite_synchronous == "FULL"
 
-        styles = {"default": "business", "styles": {"formal": {"rules": ["be polite"]}}}
-        repo.set(1, "communication_styles", styles)
+    def test_applies_synchronous_setting(self, db):
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
 
-        result = repo.get(1, "communication_styles")
-        assert result["default"] == "business"
-        assert "formal" in result["styles"]
+
+class TestTransaction:
+    def test_commits_all_writes_together(self, db):
+        repo = UserRepository(db)
+        with db.transaction():
+            repo.create("user1@example.com")
+            repo.create("user2@example.com")
+        assert len(repo.get_active_users()) == 2
+
+    def test_rolls_back_on_error(self, db):
+        repo = UserRepository(db)
+        with pytest.raises(RuntimeError), db.transaction():
+            repo.create("user1@example.com")
+            raise RuntimeError("boom")
+        assert repo.get_by_email("user1@example.com") is None
+
+    def test_other_thread_does_not_join(self, db):
+        repo = UserRepository(db)
+        with db.transaction() as tx_conn:
+            repo.create("user1@example.com")
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                other_conn, seen = pool.submit(
+                    lambda: _connection_and_lookup(db, repo, "user1@example.com")
+                ).result()
+        assert other_conn is not tx_conn
+        assert seen is None  # uncommitted write is invisible outside the transaction
+        assert repo.get_by_email("user1@example.com") is not None
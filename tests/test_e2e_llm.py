@@ -7,6 +7,14 @@ Run locally:
     GEMINI_API_KEY=... pytest tests/test_e2e_llm.py -v
     ANTHROPIC_API_KEY=... GMA_LLM_CLASSIFY_MODEL=anthropic/claude-haiku pytest tests/test_e2e_llm.py -v
 
+Every test is independent and only shares session-scoped, read-only fixtures,
+so the LLM round-trips can overlap across xdist workers:
+    GEMINI_API_KEY=... pytest tests/test_e2e_llm.py -n 8
+
+GMA_E2E_CACHE=1 answers repeated identical classify/draft prompts from memory
+for the rest of the session (per worker); leave it unset for fresh completions:
+    GEMINI_API_KEY=... GMA_E2E_CACHE=1 pytest tests/test_e2e_llm.py -n 8
+
 Skipped automatically when no API key is set.
 """
 
@@ -18,15 +26,17 @@ from src.classify.engine import ClassificationEngine
 from src.classify.prompts import CLASSIFY_SYSTEM_PROMPT, build_classify_user_message
 from src.draft.engine import DraftEngine
 from src.llm.gateway import ClassifyResult, LLMGateway
-from tests.conftest import skip_without_api_key
+from tests.conftest import load_classification_fixture, skip_without_api_key
 
 pytestmark = [pytest.mark.e2e, skip_without_api_key]
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
-VALID_CATEGORIES = {"needs_response", "action_required", "payment_request", "fyi", "waiting"}
-VALID_CONFIDENCES = {"high", "medium", "low"}
+VALID_CATEGORIES = frozenset(
+    {"needs_response", "action_required", "payment_request", "fyi", "waiting"}
+)
+VALID_CONFIDENCES = frozenset({"high", "medium", "low"})
 
 
 def _classify_via_engine(
@@ -166,136 +176,136 @@ class TestLLMGatewayDraft:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-class TestClassifyEngineE2E:
-    """Test the ClassificationEngine with real LLM calls."""
-
-    def test_needs_response_direct_question(self, llm_gateway: LLMGateway):
-        """A direct question from a colleague should be needs_response."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="jan.novak@firma.cz",
-            sender_name="Jan Novák",
-            subject="Soubor k projektu",
-            body="Ahoj, můžeš mi poslat ten soubor k projektu Alfa? Díky!",
-        )
-        assert result.category == "needs_response"
-        assert result.source == "llm"
-
-    def test_needs_response_english_feedback(self, llm_gateway: LLMGateway):
-        """English request for feedback should be needs_response."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="sarah.jones@partner.com",
-            sender_name="Sarah Jones",
-            subject="Q3 proposal",
-            body="I'd appreciate your thoughts on the proposal we discussed last week.",
-        )
-        assert result.category == "needs_response"
-        assert result.source == "llm"
-
-    def test_action_required_meeting_czech(self, llm_gateway: LLMGateway):
-        """Czech meeting request should be action_required."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="petra.kralova@firma.cz",
-            sender_name="Petra Králová",
-            subject="Žádost o schůzku na pondělí",
-            body="Ráda bych s tebou probrala výsledky auditu. Hodí se ti pondělí odpoledne?",
-        )
-        assert result.category == "action_required"
-
-    def test_action_required_sign_contract(self, llm_gateway: LLMGateway):
-        """Contract signing request should be action_required."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="legal@partner.com",
-            sender_name="Legal Department",
-            subject="Contract for signature",
-            body="Please sign the attached NDA and return it by Friday.",
-        )
-        assert result.category == "action_required"
-
-    def test_payment_request_czech_invoice(self, llm_gateway: LLMGateway):
-        """Czech invoice email should be payment_request."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="ucetni@dodavatel.cz",
-            sender_name="Účetní oddělení",
-            subject="Faktura č. 2024-0892",
-            body="V příloze zasíláme fakturu za dodané služby v měsíci říjnu.",
-        )
-        assert result.category == "payment_request"
-
-    def test_payment_request_english_invoice(self, llm_gateway: LLMGateway):
-        """English invoice with amount should be payment_request."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="billing@saas-vendor.com",
-            sender_name="Billing",
-            subject="Invoice for November",
-            body="Your invoice for consulting services is ready. Amount: $4,500.",
-        )
-        assert result.category == "payment_request"
-
-    def test_fyi_newsletter(self, llm_gateway: LLMGateway):
-        """Newsletter with unsubscribe should be fyi."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="news@techblog.io",
-            sender_name="",
-            subject="This Week in AI",
-            body="Top stories this week... To unsubscribe, click here.",
-        )
-        assert result.category == "fyi"
-
-    def test_fyi_noreply_sender(self, llm_gateway: LLMGateway):
-        """Noreply sender should be fyi (rule engine detects, safety net enforces)."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="noreply@github.com",
-            sender_name="GitHub",
-            subject="New comment on issue #42",
-            body="User xyz commented on your pull request.",
-        )
-        assert result.category == "fyi"
-
-    def test_fyi_promo_with_prices(self, llm_gateway: LLMGateway):
-        """Promotional email with CZK prices should be fyi, not payment_request."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="newsletter@shop.cz",
-            sender_name="Shop",
-            subject="Slevy až 40 %",
-            body=(
+# (email fields, expected category)
+CLASSIFY_ENGINE_CASES = [
+    # A direct question from a colleague.
+    pytest.param(
+        {
+            "sender_email": "jan.novak@firma.cz",
+            "sender_name": "Jan Novák",
+            "subject": "Soubor k projektu",
+            "body": "Ahoj, můžeš mi poslat ten soubor k projektu Alfa? Díky!",
+        },
+        "needs_response",
+        id="needs_response_direct_question",
+    ),
+    pytest.param(
+        {
+            "sender_email": "sarah.jones@partner.com",
+            "sender_name": "Sarah Jones",
+            "subject": "Q3 proposal",
+            "body": "I'd appreciate your thoughts on the proposal we discussed last week.",
+        },
+        "needs_response",
+        id="needs_response_english_feedback",
+    ),
+    pytest.param(
+        {
+            "sender_email": "petra.kralova@firma.cz",
+            "sender_name": "Petra Králová",
+            "subject": "Žádost o schůzku na pondělí",
+            "body": "Ráda bych s tebou probrala výsledky auditu. Hodí se ti pondělí odpoledne?",
+        },
+        "action_required",
+        id="action_required_meeting_czech",
+    ),
+    pytest.param(
+        {
+            "sender_email": "legal@partner.com",
+            "sender_name": "Legal Department",
+            "subject": "Contract for signature",
+            "body": "Please sign the attached NDA and return it by Friday.",
+        },
+        "action_required",
+        id="action_required_sign_contract",
+    ),
+    pytest.param(
+        {
+            "sender_email": "ucetni@dodavatel.cz",
+            "sender_name": "Účetní oddělení",
+            "subject": "Faktura č. 2024-0892",
+            "body": "V příloze zasíláme fakturu za dodané služby v měsíci říjnu.",
+        },
+        "payment_request",
+        id="payment_request_czech_invoice",
+    ),
+    pytest.param(
+        {
+            "sender_email": "billing@saas-vendor.com",
+            "sender_name": "Billing",
+            "subject": "Invoice for November",
+            "body": "Your invoice for consulting services is ready. Amount: $4,500.",
+        },
+        "payment_request",
+        id="payment_request_english_invoice",
+    ),
+    pytest.param(
+        {
+            "sender_email": "news@techblog.io",
+            "subject": "This Week in AI",
+            "body": "Top stories this week... To unsubscribe, click here.",
+        },
+        "fyi",
+        id="fyi_newsletter",
+    ),
+    # Noreply sender: the rule engine detects it, the safety net enforces fyi.
+    pytest.param(
+        {
+            "sender_email": "noreply@github.com",
+            "sender_name": "GitHub",
+            "subject": "New comment on issue #42",
+            "body": "User xyz commented on your pull request.",
+        },
+        "fyi",
+        id="fyi_noreply_sender",
+    ),
+    # Promotional email with CZK prices is fyi, not payment_request.
+    pytest.param(
+        {
+            "sender_email": "newsletter@shop.cz",
+            "sender_name": "Shop",
+            "subject": "Slevy až 40 %",
+            "body": (
                 "Využijte naše sezónní slevy! Produkt A za 299 Kč, Produkt B za 599 Kč. "
                 "Odhlásit odběr newsletteru"
             ),
-        )
-        assert result.category == "fyi"
+        },
+        "fyi",
+        id="fyi_promo_with_prices",
+    ),
+    # I sent the last message, so the thread is waiting on the other side.
+    pytest.param(
+        {
+            "sender_email": "me@firma.cz",
+            "subject": "Re: Nabídka služeb",
+            "body": "Poslal jsem nabídku klientovi minulý týden, zatím bez odpovědi.",
+        },
+        "waiting",
+        id="waiting_sent_proposal",
+    ),
+    # Even if the LLM says needs_response, the List-Unsubscribe safety net forces fyi.
+    pytest.param(
+        {
+            "sender_email": "updates@service.com",
+            "sender_name": "Service Updates",
+            "subject": "Quick update for you",
+            "body": "Here's your weekly activity summary. You had 5 new messages this week.",
+            "headers": {"List-Unsubscribe": "<mailto:unsub@service.com>"},
+        },
+        "fyi",
+        id="automated_header_overrides_to_fyi",
+    ),
+]
 
-    def test_waiting_sent_proposal(self, llm_gateway: LLMGateway):
-        """Email where I sent the last message should be waiting."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="me@firma.cz",
-            sender_name="",
-            subject="Re: Nabídka služeb",
-            body="Poslal jsem nabídku klientovi minulý týden, zatím bez odpovědi.",
-        )
-        assert result.category == "waiting"
 
-    def test_automated_header_overrides_to_fyi(self, llm_gateway: LLMGateway):
-        """Email with List-Unsubscribe header: safety net overrides needs_response to fyi."""
-        result = _classify_via_engine(
-            llm_gateway,
-            sender_email="updates@service.com",
-            sender_name="Service Updates",
-            subject="Quick update for you",
-            body="Here's your weekly activity summary. You had 5 new messages this week.",
-            headers={"List-Unsubscribe": "<mailto:unsub@service.com>"},
-        )
-        # Even if LLM says needs_response, the safety net overrides to fyi
-        assert result.category == "fyi"
+class TestClassifyEngineE2E:
+    """Test the ClassificationEngine with real LLM calls, one case per test."""
+
+    @pytest.mark.parametrize("fields,expected", CLASSIFY_ENGINE_CASES)
+    def test_classify(self, llm_gateway: LLMGateway, fields: dict, expected: str):
+        result = _classify_via_engine(llm_gateway, **fields)
+        assert result.category == expected
+        assert result.source == "llm"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -306,46 +316,30 @@ class TestClassifyEngineE2E:
 class TestClassifyFromFixtures:
     """Run classification against the YAML fixture cases with a real LLM."""
 
-    def test_fixture_cases(
-        self,
-        llm_gateway: LLMGateway,
-        classification_cases: list[dict],
-        classification_defaults: dict,
-    ):
+    @pytest.mark.parametrize(
+        "case", load_classification_fixture()["cases"], ids=lambda case: case["id"]
+    )
+    def test_fixture_case(self, llm_gateway: LLMGateway, classification_defaults: dict, case: dict):
         """Each YAML fixture case should classify to its expected category."""
-        failures = []
-
-        for case in classification_cases:
-            case_id = case["id"]
-            expected = case["expected_category"]
-
-            result = _classify_via_engine(
-                llm_gateway,
-                sender_email=case.get("sender_email", "test@example.com"),
-                sender_name=case.get("sender_name", classification_defaults.get("sender_name", "")),
-                subject=case.get("subject", ""),
-                body=case.get("body", ""),
-                snippet=case.get("snippet", classification_defaults.get("snippet", "")),
-                message_count=case.get(
-                    "message_count", classification_defaults.get("message_count", 1)
-                ),
-                blacklist=case.get("blacklist", classification_defaults.get("blacklist", [])),
-                contacts_config=case.get(
-                    "contacts_config", classification_defaults.get("contacts_config", {})
-                ),
-            )
-
-            if result.category != expected:
-                failures.append(
-                    f"  {case_id}: expected={expected}, got={result.category} "
-                    f"(confidence={result.confidence}, reason={result.reasoning[:80]})"
-                )
-
-        if failures:
-            # Report all failures at once for easy debugging
-            msg = f"{len(failures)}/{len(classification_cases)} fixture cases misclassified:\n"
-            msg += "\n".join(failures)
-            pytest.fail(msg)
+        result = _classify_via_engine(
+            llm_gateway,
+            sender_email=case.get("sender_email", "test@example.com"),
+            sender_name=case.get("sender_name", classification_defaults.get("sender_name", "")),
+            subject=case.get("subject", ""),
+            body=case.get("body", ""),
+            snippet=case.get("snippet", classification_defaults.get("snippet", "")),
+            message_count=case.get(
+                "message_count", classification_defaults.get("message_count", 1)
+            ),
+            blacklist=case.get("blacklist", classification_defaults.get("blacklist", [])),
+            contacts_config=case.get(
+                "contacts_config", classification_defaults.get("contacts_config", {})
+            ),
+        )
+        assert result.category == case["expected_category"], (
+            f"{case['description']} "
+            f"(confidence={result.confidence}, reason={result.reasoning[:80]})"
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -48,6 +48,37 @@ class TestMessageParsing:
         assert msg.sender_email == "plain@example.com"
         assert msg.sender_name == ""
 
+    def test_from_api_quoted_name_with_trailing_text(self):
+        data = {
+            "id": "msg_4",
+            "threadId": "thread_4",
+            "payload": {
+                "headers": [
+                    {"name": "From", "value": '"Doe, Jane" <jane@example.com> (via List)'},
+                ],
+            },
+        }
+        msg = Message.from_api(data)
+        assert msg.sender_name == "Doe, Jane"
+        assert msg.sender_email == "jane@example.com"
+
+    def test_from_api_header_names_case_insensitive(self):
+        data = {
+            "id": "msg_3",
+            "threadId": "thread_3",
+            "payload": {
+                "headers": [
+                    {"name": "FROM", "value": "Sender <sender@example.com>"},
+                    {"name": "subject", "value": "Lowercase"},
+                    {"name": "Message-Id", "value": "<abc@example.com>"},
+                ],
+            },
+        }
+        msg = Message.from_api(data)
+        assert msg.sender_email == "sender@example.com"
+        assert msg.subject == "Lowercase"
+        assert msg.headers["Message-Id"] == "<abc@example.com>"
+
 
 class TestThread:
     def test_from_api(self):
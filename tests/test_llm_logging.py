@@ -20,6 +20,7 @@ def db(tmp_path):
 
     config = AppConfig.from_yaml()
     config.database.sqlite_path = str(tmp_path / "test.db")
+    config.database.sqlite_synchronous = "OFF"
     db = Database(config)
     db.initialize_schema()
 
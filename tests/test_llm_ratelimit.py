@@ -0,0 +1,82 @@
+"""Tests for the LLM client-side rate limiter."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.llm.config import LLMConfig
+from src.llm.gateway import LLMGateway
+from src.llm.ratelimit import RateLimiter
+
+
+class _FakeClock:
+    """Stands in for the time module: sleeping advances monotonic time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = _FakeClock()
+    with patch("src.llm.ratelimit.time", fake):
+        yield fake
+
+
+class TestRateLimiter:
+    def test_first_call_does_not_wait(self, clock):
+        limiter = RateLimiter(60)
+        assert limiter.acquire() == 0
+        assert clock.sleeps == []
+
+    def test_back_to_back_calls_are_spaced(self, clock):
+        limiter = RateLimiter(60)
+        waits = [limiter.acquire() for _ in range(3)]
+        assert waits == [0, 1.0, 1.0]
+
+    def test_idle_time_is_not_banked(self, clock):
+        limiter = RateLimiter(60)
+        limiter.acquire()
+        clock.now += 10
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 1.0
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+
+
+class TestGatewayRateLimit:
+    def test_unlimited_by_default(self):
+        assert LLMGateway(LLMConfig()).rate_limiter is None
+
+    @patch("litellm.completion")
+    def test_calls_acquire_before_completion(self, mock_completion):
+        mock_completion.return_value.choices[0].message.content = '{"category": "fyi"}'
+        gateway = LLMGateway(LLMConfig(requests_per_minute=30))
+        assert isinstance(gateway.rate_limiter, RateLimiter)
+
+        # Completions already made at each acquire: every wait precedes its call
+        completions_at_acquire = []
+        gateway.rate_limiter = Mock()
+        gateway.rate_limiter.acquire.side_effect = lambda: completions_at_acquire.append(
+            mock_completion.call_count
+        )
+
+        gateway.classify("system", "user")
+        gateway.draft("system", "user")
+        gateway.generate_context_queries("system", "user")
+        gateway.agent_completion([{"role": "user", "content": "hi"}], tools=[])
+
+        assert completions_at_acquire == [0, 1, 2, 3]
+        assert mock_completion.call_count == 4
@@ -3,6 +3,9 @@
 CR-01: Rules only detect automation. Content pattern tests removed.
 """
 
+import pytest
+
+from src.classify import rules
 from src.classify.rules import classify_by_rules, resolve_communication_style
 
 
@@ -30,114 +33,153 @@ class TestBlacklistMatching:
         )
         assert result.matched is False
 
-    def test_empty_blacklist_normal_sender(self):
+    def test_domain_match_is_case_insensitive(self):
         result = classify_by_rules(
-            sender_email="colleague@company.com",
-            subject="Hello",
-            snippet="Quick update",
-            body="",
-            blacklist=[],
-        )
-        assert result.matched is False
-
-
-class TestAutomatedSender:
-    def test_noreply(self):
-        result = classify_by_rules(
-            sender_email="noreply@company.com",
-            subject="Your order",
+            sender_email="Bot@NoReply.GitHub.com",
+            subject="New PR",
             snippet="",
             body="",
-            blacklist=[],
+            blacklist=["*@noreply.github.com"],
         )
-        assert result.category == "fyi"
         assert result.matched is True
-        assert result.is_automated is True
 
-    def test_notifications(self):
+    def test_subdomain_does_not_match_exact_domain(self):
         result = classify_by_rules(
-            sender_email="notifications@service.com",
-            subject="Update",
+            sender_email="person@mail.spam.com",
+            subject="Hello",
             snippet="",
             body="",
-            blacklist=[],
+            blacklist=["*@spam.com"],
         )
-        assert result.category == "fyi"
-        assert result.matched is True
-        assert result.is_automated is True
-
+        assert result.matched is False
 
-class TestHeaderDetection:
-    def test_auto_submitted(self):
+    def test_glob_pattern_fallback(self):
+        blacklist = ["*@*.spam.com", "newsletter@*"]
+        for sender in ("person@mail.spam.com", "newsletter@shop.cz"):
+            result = classify_by_rules(
+                sender_email=sender,
+                subject="Hello",
+                snippet="",
+                body="",
+                blacklist=blacklist,
+            )
+            assert result.matched is True, sender
+
+    def test_subdomain_entry(self):
+        blacklist = ["*@*.spam.com"]
+        for sender, expected in (
+            ("person@mail.spam.com", True),
+            ("person@a.b.spam.com", True),
+            ("person@spam.com", False),
+            ("person@notspam.com", False),
+        ):
+            result = classify_by_rules(sender, "Hello", "", "", blacklist)
+            assert result.matched is expected, sender
+
+    def test_exact_address_entry(self):
+        blacklist = ["Spammer@Example.com"]
+        hit = classify_by_rules("spammer@example.com", "Hi", "", "", blacklist)
+        miss = classify_by_rules("other@example.com", "Hi", "", "", blacklist)
+        assert hit.matched is True
+        assert miss.matched is False
+
+    def test_blacklist_hit_skips_other_checks(self, monkeypatch):
+        """A blacklist hit returns before sender-pattern or header inspection."""
+
+        def _fail(*_args):
+            raise AssertionError("automation checks should not run for blacklisted senders")
+
+        monkeypatch.setattr(rules, "_is_automated_sender", _fail)
+        monkeypatch.setattr(rules, "_detect_automated_headers", _fail)
         result = classify_by_rules(
-            sender_email="system@company.com",
-            subject="Report",
+            sender_email="promo@spam.com",
+            subject="Sale",
             snippet="",
             body="",
-            blacklist=[],
-            headers={"Auto-Submitted": "auto-generated"},
+            blacklist=["*@spam.com"],
+            headers={"List-Unsubscribe": "<mailto:unsub@spam.com>"},
         )
-        assert result.category == "fyi"
         assert result.matched is True
-        assert result.is_automated is True
+        assert "blacklist" in result.reasoning
 
-    def test_list_unsubscribe(self):
+    def test_empty_blacklist_normal_sender(self):
         result = classify_by_rules(
-            sender_email="promo@shop.com",
-            subject="Sale",
-            snippet="",
+            sender_email="colleague@company.com",
+            subject="Hello",
+            snippet="Quick update",
             body="",
             blacklist=[],
-            headers={"List-Unsubscribe": "<mailto:unsub@shop.com>"},
         )
-        assert result.category == "fyi"
-        assert result.matched is True
-        assert result.is_automated is True
+        assert result.matched is False
 
 
-class TestContentPassesToLLM:
-    """Content-based emails are no longer classified by rules."""
+_AUTOMATED = ("fyi", "high", True, True)
+_PASS_TO_LLM = ("needs_response", "low", False, False)
+
+# (classify_by_rules kwargs, (category, confidence, matched, is_automated))
+RULE_CASES = [
+    pytest.param(
+        {"sender_email": "noreply@company.com", "subject": "Your order"}, _AUTOMATED, id="noreply"
+    ),
+    pytest.param({"sender_email": "notifications@service.com"}, _AUTOMATED, id="notifications"),
+    pytest.param(
+        {"sender_email": "system@company.com", "headers": {"Auto-Submitted": "auto-generated"}},
+        _AUTOMATED,
+        id="auto_submitted",
+    ),
+    pytest.param(
+        {"sender_email": "promo@shop.com", "headers": {"List-Unsubscribe": "<mailto:u@shop.com>"}},
+        _AUTOMATED,
+        id="list_unsubscribe",
+    ),
+    # Content-based emails are no longer classified by rules.
+    pytest.param(
+        {"sender_email": "vendor@company.com", "subject": "Invoice #12345"},
+        _PASS_TO_LLM,
+        id="invoice",
+    ),
+    pytest.param(
+        {"sender_email": "hr@company.com", "snippet": "Please sign the attached document"},
+        _PASS_TO_LLM,
+        id="action",
+    ),
+    pytest.param(
+        {"sender_email": "colleague@company.com", "body": "Are you free tomorrow?"},
+        _PASS_TO_LLM,
+        id="question",
+    ),
+    pytest.param(
+        {"sender_email": "person@company.com", "snippet": "Here's the latest version"},
+        _PASS_TO_LLM,
+        id="ambiguous",
+    ),
+]
+
+
+@pytest.mark.parametrize("inputs,expected", RULE_CASES)
+def test_rule_case(inputs, expected):
+    kwargs = {"subject": "", "snippet": "", "body": "", **inputs}
+    result = classify_by_rules(**kwargs)
+    assert (result.category, result.confidence, result.matched, result.is_automated) == expected
 
-    def test_invoice_passes_through(self):
-        result = classify_by_rules(
-            sender_email="vendor@company.com",
-            subject="Invoice #12345",
-            snippet="",
-            body="",
-            blacklist=[],
-        )
-        assert result.matched is False
 
-    def test_action_passes_through(self):
-        result = classify_by_rules(
-            sender_email="hr@company.com",
-            subject="Contract",
-            snippet="Please sign the attached document",
-            body="",
-            blacklist=[],
+class TestHeaderDetection:
+    def test_header_value_is_normalized(self):
+        padded = classify_by_rules(
+            "system@company.com", "Report", "", "", [], headers={"Precedence": " Bulk\r\n"}
         )
-        assert result.matched is False
-
-    def test_question_passes_through(self):
-        result = classify_by_rules(
-            sender_email="colleague@company.com",
-            subject="Meeting",
-            snippet="",
-            body="Are you free tomorrow?",
-            blacklist=[],
+        opt_out = classify_by_rules(
+            "system@company.com", "Report", "", "", [], headers={"Auto-Submitted": "NO"}
         )
-        assert result.matched is False
+        assert padded.matched is True
+        assert opt_out.matched is False
 
-    def test_ambiguous_passes_through(self):
+    def test_header_name_is_case_insensitive(self):
         result = classify_by_rules(
-            sender_email="person@company.com",
-            subject="Update",
-            snippet="Here's the latest version",
-            body="",
-            blacklist=[],
+            "promo@shop.com", "Sale", "", "", headers={"list-unsubscribe": "<mailto:u@shop.com>"}
         )
-        assert result.matched is False
-        assert result.confidence == "low"
+        assert result.matched is True
+        assert "List-Unsubscribe" in result.reasoning
 
 
 class TestCommunicationStyle:
@@ -160,3 +202,24 @@ class TestCommunicationStyle:
 
     def test_empty_config(self):
         assert resolve_communication_style("anyone@example.com", None) == "business"
+
+    def test_literal_domain_override(self):
+        config = {"style_overrides": {}, "domain_overrides": {"school.cz": "formal"}}
+        assert resolve_communication_style("teacher@School.cz", config) == "formal"
+        assert resolve_communication_style("teacher@high.school.cz", config) == "business"
+
+    def test_no_at_sign_returns_business(self):
+        config = {"style_overrides": {}, "domain_overrides": {"*": "formal"}}
+        assert resolve_communication_style("not-an-email", config) == "business"
+
+    def test_domain_override_first_match_wins(self):
+        config = {
+            "style_overrides": {},
+            "domain_overrides": {"*.gov.cz": "formal", "*.cz": "informal"},
+        }
+        rules._style_for_domain.cache_clear()
+        assert resolve_communication_style("a@office.gov.cz", config) == "formal"
+        assert resolve_communication_style("b@firma.cz", config) == "informal"
+        # A repeated domain is answered from the cache without re-matching globs
+        assert resolve_communication_style("c@office.gov.cz", config) == "formal"
+        assert rules._style_for_domain.cache_info().hits == 1